@@ -1,60 +1,394 @@
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from concurrent.futures import Future
 from datetime import date
 import threading
-import json
+import hashlib
+import sys
+import logging
+import queue
+import time
+import orjson
 import os
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+# fdatasync skips flushing metadata such as mtime; not every platform has it
+sync_file = getattr(os, "fdatasync", os.fsync)
+
+def sync_directory(path):
+    """fsync the directory holding path so a rename into it survives power loss"""
+    if os.name != "posix":
+        return  # Directories cannot be opened for syncing on Windows
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 # Remove the circular import and add AttendanceTracker class here
 class AttendanceTracker:
+    # Fold the journal into a fresh snapshot once it grows past this many bytes
+    COMPACT_THRESHOLD = 1024 * 1024
+    # Group commit: how long (seconds) the writer waits for more events to
+    # join a batch, and how many events end the wait early
+    COMMIT_DELAY = 0.0005
+    MAX_BATCH_SIZE = 64
+    # One byte per cell in the attendance matrix; 0 means not recorded
+    STATUS_CODES = {'present': 1, 'absent': 2}
+    STATUS_NAMES = (None, 'present', 'absent')
+    # How long (seconds) to wait for another process to release the data
+    # files, e.g. the old worker during a gunicorn reload
+    LOCK_TIMEOUT = 20
+
     def __init__(self, filename="attendance.json"):
         self.filename = filename
-        self.students = set()
-        self.records = {}
-        try:
-            self.load_from_file()
-        except FileNotFoundError:
-            pass
+        self.journal_filename = filename + ".log"
+        # Guards every mutation and cache rebuild; the journal line is queued
+        # under it too so the journal order matches the in-memory order
+        self._lock = threading.RLock()
+        # Append-only journal: one JSON line per mutation since the last snapshot
+        self.journal_fd = os.open(self.journal_filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.lock_journal()
+        self.load_state()
+        # Requests queue journal lines here; a background thread writes them
+        self._queue = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def lock_journal(self):
+        """Take an exclusive lock on the journal so only one process owns the data files"""
+        # State lives in this process's memory; a second process writing the
+        # same files would silently diverge from it, so wait for the current
+        # owner to let go and give up if it never does
+        if fcntl is None:
+            return
+        deadline = time.monotonic() + self.LOCK_TIMEOUT
+        while True:
+            try:
+                fcntl.flock(self.journal_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    os.close(self.journal_fd)
+                    raise RuntimeError(f'{self.filename} is already in use by another process') from None
+                time.sleep(0.1)
+
+    def load_state(self):
+        """Build the in-memory state from the snapshot and journal on disk"""
+        # Roster: name -> insertion index, so iteration order is stable
+        self.students = {}
+        # Attendance is stored column-wise: one bytearray row per date, indexed
+        # by each student's column, instead of a dict per date
+        self.dates = []
+        self.date_index = {}
+        self.student_ids = {}
+        self.matrix = []
+        # Sequence number of the latest mutation. Derived results are cached
+        # against it, and it is persisted with the snapshot and each journal
+        # line so replay can skip lines the snapshot already covers
+        self._version = 0
+        self._cache = {}
+        self.load_from_file()
+        self.count_attendance()
+        # Immutable roster in insertion order, handed out to readers as-is
+        self.students_snapshot = tuple(self.students)
+        self.journal_size = os.fstat(self.journal_fd).st_size
 
     def add_student(self, name):
-        self.students.add(name)
-        self.save_to_file()  # Save after adding student
+        with self._lock:
+            self.check_open()
+            self.enroll(name)
+            self.students_snapshot = tuple(self.students)
+            self.present_count.setdefault(name, 0)
+            self._version += 1
+            done = self.append_event({"op": "add", "student": name, "seq": self._version})
+        done.result()
 
     def load_from_file(self):
+        """Load the snapshot, if there is one, then replay the journal over it"""
+        try:
+            f = open(self.filename, "rb")
+        except FileNotFoundError:
+            pass  # First boot: start from the empty state set up in load_state
+        else:
+            with f:
+                data = orjson.loads(f.read())
+            self._version = data.get("seq", 0)
+            for name in data.get("students", []):
+                self.enroll(name)
+            for date_str, date_records in data.get("records", {}).items():
+                for student, status in date_records.items():
+                    self.set_status(date_str, student, status)
+        self.replay_journal(self._version)
+
+    def replay_journal(self, snapshot_seq=0):
+        """Re-apply mutations journalled after the last snapshot"""
         try:
-            with open(self.filename) as f:
-                data = json.load(f)
-                self.students = set(data.get("students", []))
-                self.records = data.get("records", {})
+            f = open(self.journal_filename, "rb")
         except FileNotFoundError:
-            self.students = set()
-            self.records = {}
+            return
+        good_size = 0
+        with f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Torn final line from an interrupted write
+                try:
+                    event = orjson.loads(line)
+                except ValueError:
+                    break
+                # Lines from before the snapshot (left behind by a crash mid
+                # compaction) would roll its cells back
+                if event["seq"] > snapshot_seq:
+                    self.apply_event(event)
+                    self._version = event["seq"]
+                good_size += len(line)
+        # Cut off the torn tail, otherwise the next append would be glued onto
+        # it and every later replay would stop at the merged line
+        if good_size < os.fstat(self.journal_fd).st_size:
+            os.ftruncate(self.journal_fd, good_size)
+            sync_file(self.journal_fd)
+
+    def count_attendance(self):
+        """Build the per-student present counters from the loaded records"""
+        self.present_count = dict.fromkeys(self.students, 0)
+        self.total_days = len(self.dates)
+        present = self.STATUS_CODES['present']
+        for student in self.present_count:
+            j = self.student_ids.get(student)
+            if j is not None:
+                self.present_count[student] = sum(
+                    1 for row in self.matrix if j < len(row) and row[j] == present)
+
+    def get_status(self, date_str, student):
+        """Look up one attendance cell, or None if it was never recorded"""
+        i = self.date_index.get(date_str)
+        j = self.student_ids.get(student)
+        if i is None or j is None:
+            return None
+        row = self.matrix[i]
+        return self.STATUS_NAMES[row[j]] if j < len(row) else None
+
+    def set_status(self, date_str, student, status):
+        """Store one attendance cell, returning the status it replaced"""
+        # Resolve the code first so a rejected status leaves no empty row behind
+        code = self.STATUS_CODES[status]
+        i = self.date_index.get(date_str)
+        if i is None:
+            date_str = sys.intern(date_str)
+            i = self.date_index[date_str] = len(self.dates)
+            self.dates.append(date_str)
+            self.matrix.append(bytearray())
+        j = self.student_ids.get(student)
+        if j is None:
+            j = self.student_ids[sys.intern(student)] = len(self.student_ids)
+        row = self.matrix[i]
+        if j >= len(row):
+            row.extend(bytes(j + 1 - len(row)))
+        prior = row[j]
+        row[j] = code
+        return self.STATUS_NAMES[prior]
+
+    def enroll(self, name):
+        """Add a name to the roster, keeping its original position if already there"""
+        self.students.setdefault(sys.intern(name), len(self.students))
+
+    def apply_event(self, event):
+        """Apply a single journal event to the in-memory state"""
+        if event["op"] == "add":
+            self.enroll(event["student"])
+        elif event["op"] == "mark":
+            self.set_status(event["date"], event["student"], event["status"])
+
+    def append_event(self, event):
+        """Hand a mutation to the journal writer; the returned future resolves once it is durable"""
+        # Callers hold self._lock, so this cannot race with close()
+        self.check_open()
+        done = Future()
+        self._queue.put((orjson.dumps(event) + b"\n", done))
+        return done
+
+    def flush(self):
+        """Block until every queued journal line is on disk"""
+        done = Future()
+        with self._lock:
+            self.check_open()
+            self._queue.put((b"", done))
+        done.result()
+
+    def check_open(self):
+        """Refuse journal work once close() has queued the writer's sentinel"""
+        if self._closed:
+            raise RuntimeError(f'{self.filename} tracker is closed')
+
+    def close(self):
+        """Flush the journal, stop the writer thread and release the data files"""
+        with self._lock:
+            self.check_open()
+            self._closed = True
+            # The writer drains everything queued ahead of the sentinel, then exits
+            self._queue.put(None)
+        self._writer.join()
+        os.close(self.journal_fd)
+
+    def _write_loop(self):
+        """Writer thread: drain the queue in batches, one write+fsync per batch"""
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.COMMIT_DELAY
+            while True:
+                if item is None:
+                    stopping = True  # Sentinel from close()
+                    break
+                batch.append(item)
+                if len(batch) >= self.MAX_BATCH_SIZE:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            if not batch:
+                continue
+            # A None line is a compact() request rather than journal data
+            writes = [(line, done) for line, done in batch if line is not None]
+            compactions = [done for line, done in batch if line is None]
+            try:
+                self.write_batch(b"".join(line for line, _ in writes))
+            except Exception as e:
+                log.exception('Journal write failed; rolling back to the state on disk')
+                stopping = self.discard_unwritten(batch) or stopping
+                for _, done in batch:
+                    done.set_exception(e)
+                continue
+            for _, done in writes:
+                done.set_result(None)
+            if compactions or self.journal_size >= self.COMPACT_THRESHOLD:
+                try:
+                    self._compact()
+                except Exception as e:
+                    # The batch is already durable, so only the compaction
+                    # failed; keep the journal and retry after the next batch
+                    log.exception('Journal compaction failed')
+                    for done in compactions:
+                        done.set_exception(e)
+                else:
+                    for done in compactions:
+                        done.set_result(None)
+
+    def discard_unwritten(self, batch):
+        """Undo a failed batch in memory by reloading from disk; True if close() was drained"""
+        stopping = False
+        with self._lock:
+            # Everything still queued was applied on top of the failed batch,
+            # so it has to fail with it
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+            try:
+                self.load_state()
+            except Exception:
+                log.exception('Could not reload state after a failed journal write')
+        return stopping
+
+    def write_batch(self, data):
+        """Write and fsync a batch of journal lines, leaving the journal unchanged on failure"""
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self.journal_fd, view):]  # Retry short writes
+            sync_file(self.journal_fd)
+        except BaseException:
+            # Drop any partial bytes so the next batch starts on a line boundary
+            os.ftruncate(self.journal_fd, self.journal_size)
+            raise
+        self.journal_size += len(data)
 
     def save_to_file(self):
-        with open(self.filename, "w") as f:
-            json.dump({
-                "students": list(self.students),
-                "records": self.records
-            }, f, indent=2)
+        """Atomically and durably replace the snapshot with the current state"""
+        # get_records() hands back a mapping that is never mutated afterwards,
+        # so only the references need taking under the lock
+        with self._lock:
+            seq = self._version
+            students = self.students_snapshot
+            records = self.get_records()
+        tmp_filename = self.filename + ".tmp"
+        with open(tmp_filename, "wb") as f:
+            f.write(orjson.dumps({
+                "seq": seq,
+                "students": students,
+                "records": records
+            }, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, self.filename)
+        sync_directory(self.filename)
+
+    def compact(self):
+        """Have the writer thread fold the journal into a new snapshot, and wait for it"""
+        done = Future()
+        with self._lock:
+            self.check_open()
+            self._queue.put((None, done))
+        done.result()
+
+    def _compact(self):
+        """Write a snapshot and start an empty journal; writer thread only"""
+        # Only the writer appends to the journal, so no line can land between
+        # the snapshot and the truncate. The snapshot is on disk before the
+        # journal is cut. It may already hold mutations still queued for the
+        # journal, but replay skips every line whose seq the snapshot covers,
+        # so a crash at any point here cannot roll cells back to older values
+        self.save_to_file()
+        os.ftruncate(self.journal_fd, 0)
+        sync_file(self.journal_fd)
+        self.journal_size = 0
     
     def mark_attendance(self, date_str, student, status):
-        """Mark attendance for a student on a specific date"""
-        if date_str not in self.records:
-            self.records[date_str] = {}
-        self.records[date_str][student] = status
-        self.save_to_file()
+        """Mark attendance for a student on a specific date, returning False if nothing changed"""
+        with self._lock:
+            self.check_open()
+            # Repeat submissions (double clicks, retries) cost no journal write
+            if self.get_status(date_str, student) == status:
+                return False
+            new_date = date_str not in self.date_index
+            prior = self.set_status(date_str, student, status)
+            # Only count the day once the cell is actually stored
+            if new_date:
+                self.total_days += 1
+            # Keep the present counter in step with this one cell's transition
+            if student in self.present_count:
+                if status == 'present' and prior != 'present':
+                    self.present_count[student] += 1
+                elif status != 'present' and prior == 'present':
+                    self.present_count[student] -= 1
+            self._version += 1
+            done = self.append_event({"op": "mark", "date": date_str, "student": student, "status": status,
+                                      "seq": self._version})
+        done.result()
+        return True
     
     def get_summary(self):
         """Calculate attendance summary for all students"""
+        return self.cached('summary', self._build_summary)
+
+    def _build_summary(self):
+        total_days = self.total_days
         summary = {}
-        for student in self.students:
-            present_days = 0
-            total_days = len(self.records)
-            
-            # Count present days for this student
-            for date_records in self.records.values():
-                if date_records.get(student) == 'present':
-                    present_days += 1
-            
+        for student, present_days in self.present_count.items():
             # Calculate percentage
             percentage = (present_days / total_days * 100) if total_days > 0 else 0
             summary[student] = {
@@ -64,11 +398,74 @@ class AttendanceTracker:
             }
         return summary
 
+    def get_records(self):
+        """Rebuild the date -> student -> status mapping from the matrix"""
+        return self.cached('records', self._build_records)
+
+    def _build_records(self):
+        names = list(self.student_ids)
+        records = {}
+        for date_str, row in zip(self.dates, self.matrix):
+            records[date_str] = {names[j]: self.STATUS_NAMES[code] for j, code in enumerate(row) if code}
+        return records
+
+    def cached(self, key, build):
+        """Return build()'s result, reusing it until the next mutation"""
+        # Fast path reads without the lock: entries are replaced, never mutated
+        entry = self._cache.get(key)
+        if entry is None or entry[0] != self._version:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is None or entry[0] != self._version:
+                    entry = self._cache[key] = (self._version, build())
+        return entry[1]
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson instead of the stdlib json module"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Build the body straight from orjson's bytes, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
+
 # Remove this line since we defined the class above
 # from attendance_system import AttendanceTracker
 
 app = Flask(__name__, static_folder="static", template_folder="templates")
-tracker = AttendanceTracker()
+app.json = ORJSONProvider(app)
+
+# Success responses have a fixed shape, so only the payload is encoded per
+# response and spliced between a prebuilt prefix and the closing brace
+MESSAGE_PREFIX = b'{"success":true,"message":'
+STUDENTS_PREFIX = b'{"success":true,"students":'
+SUMMARY_PREFIX = b'{"success":true,"summary":'
+RECORDS_PREFIX = b'{"success":true,"records":'
+
+def success_body(prefix, payload):
+    """Encode a success response body from its prefix and payload"""
+    return prefix + orjson.dumps(payload) + b'}'
+
+def success_message(message):
+    """JSON success response carrying a message"""
+    return app.response_class(success_body(MESSAGE_PREFIX, message), mimetype='application/json')
+
+def cached_json(key, prefix, build):
+    """JSON success response whose body is encoded once per tracker version"""
+    body = tracker.cached(key, lambda: success_body(prefix, build()))
+    return app.response_class(body, mimetype='application/json')
+
+def encode_with_etag(prefix, payload):
+    """Encode a success response body and derive a content-based ETag for it"""
+    body = success_body(prefix, payload)
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+tracker = AttendanceTracker(os.environ.get("ATTENDANCE_FILE", "attendance.json"))
 
 @app.route('/')
 def index():
@@ -88,8 +485,9 @@ def add_student():
         if name in tracker.students:
             return jsonify({'success': False, 'message': f'Student "{name}" already exists'})
         
+        # Waits for the group commit so a failed write is reported, not dropped
         tracker.add_student(name)
-        return jsonify({'success': True, 'message': f'Successfully added student: {name}'})
+        return success_message(f'Successfully added student: {name}')
     
     except Exception as e:
         return jsonify({'success': False, 'message': f'Error: {str(e)}'})
@@ -112,8 +510,15 @@ def mark_attendance():
         if status not in ['present', 'absent']:
             return jsonify({'success': False, 'message': 'Status must be "present" or "absent"'})
         
-        tracker.mark_attendance(date_str, student, status)
-        return jsonify({'success': True, 'message': f'Marked {student} as {status} on {date_str}'})
+        try:
+            # Normalise so equivalent spellings land on the same day
+            date_str = date.fromisoformat(date_str).isoformat()
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'message': 'Date must be in YYYY-MM-DD format'})
+        
+        if not tracker.mark_attendance(date_str, student, status):
+            return success_message(f'{student} is already marked as {status} on {date_str} (no change)')
+        return success_message(f'Marked {student} as {status} on {date_str}')
     
     except Exception as e:
         return jsonify({'success': False, 'message': f'Error: {str(e)}'})
@@ -122,10 +527,7 @@ def mark_attendance():
 def get_students():
     """Get list of all students"""
     try:
-        return jsonify({
-            'success': True, 
-            'students': list(tracker.students)
-        })
+        return cached_json('students_json', STUDENTS_PREFIX, lambda: tracker.students_snapshot)
     except Exception as e:
         return jsonify({'success': False, 'message': f'Error: {str(e)}'})
 
@@ -133,11 +535,7 @@ def get_students():
 def get_summary():
     """Get attendance summary"""
     try:
-        summary = tracker.get_summary()
-        return jsonify({
-            'success': True, 
-            'summary': summary
-        })
+        return cached_json('summary_json', SUMMARY_PREFIX, tracker.get_summary)
     except Exception as e:
         return jsonify({'success': False, 'message': f'Error: {str(e)}'})
 
@@ -145,253 +543,13 @@ def get_summary():
 def get_records():
     """Get all attendance records"""
     try:
-        return jsonify({
-            'success': True, 
-            'records': tracker.records
-        })
+        body, etag = tracker.cached('records_json', lambda: encode_with_etag(RECORDS_PREFIX, tracker.get_records()))
+        response = app.response_class(body, mimetype='application/json')
+        response.set_etag(etag)
+        # Pollers that already hold this ETag get an empty 304 instead
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({'success': False, 'message': f'Error: {str(e)}'})
 
-def create_template():
-    """Create the HTML template if it doesn't exist"""
-    template_dir = 'templates'
-    if not os.path.exists(template_dir):
-        os.makedirs(template_dir)
-    
-    html_content = '''<!DOCTYPE html>
-<html>
-<head>
-    <title>Attendance System</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        .section {
-            margin: 20px 0;
-            padding: 20px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-        }
-        h1, h2 {
-            color: #333;
-        }
-        input, select, button {
-            padding: 10px;
-            margin: 5px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-        }
-        button {
-            background: #007bff;
-            color: white;
-            border: none;
-            cursor: pointer;
-        }
-        button:hover {
-            background: #0056b3;
-        }
-        .message {
-            padding: 10px;
-            margin: 10px 0;
-            border-radius: 4px;
-        }
-        .success {
-            background: #d4edda;
-            color: #155724;
-            border: 1px solid #c3e6cb;
-        }
-        .error {
-            background: #f8d7da;
-            color: #721c24;
-            border: 1px solid #f5c6cb;
-        }
-        .student-item {
-            padding: 8px;
-            margin: 5px 0;
-            background: #f8f9fa;
-            border-left: 4px solid #007bff;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Attendance Tracking System</h1>
-        
-        <div class="section">
-            <h2>Add Student</h2>
-            <input type="text" id="studentName" placeholder="Enter student name">
-            <button onclick="addStudent()">Add Student</button>
-            <div id="addMessage"></div>
-        </div>
-
-        <div class="section">
-            <h2>Mark Attendance</h2>
-            <input type="text" id="attendanceStudent" placeholder="Student name">
-            <select id="attendanceStatus">
-                <option value="present">Present</option>
-                <option value="absent">Absent</option>
-            </select>
-            <button onclick="markAttendance()">Mark Attendance</button>
-            <div id="attendanceMessage"></div>
-        </div>
-
-        <div class="section">
-            <h2>View Data</h2>
-            <button onclick="loadStudents()">Show Students</button>
-            <button onclick="loadSummary()">Show Summary</button>
-            <button onclick="loadRecords()">Show Records</button>
-            
-            <div id="studentsList"></div>
-            <div id="summaryResult"></div>
-            <div id="recordsResult"></div>
-        </div>
-    </div>
-
-    <script>
-        function showMessage(elementId, message, isSuccess) {
-            const element = document.getElementById(elementId);
-            element.innerHTML = '<div class="message ' + (isSuccess ? 'success' : 'error') + '">' + message + '</div>';
-            setTimeout(function() { element.innerHTML = ''; }, 5000);
-        }
-
-        async function addStudent() {
-            const name = document.getElementById('studentName').value.trim();
-            if (!name) {
-                showMessage('addMessage', 'Please enter a student name', false);
-                return;
-            }
-
-            try {
-                const response = await fetch('/add_student', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({name: name})
-                });
-                const result = await response.json();
-                showMessage('addMessage', result.message, result.success);
-                if (result.success) {
-                    document.getElementById('studentName').value = '';
-                }
-            } catch (error) {
-                showMessage('addMessage', 'Error: ' + error.message, false);
-            }
-        }
-
-        async function markAttendance() {
-            const student = document.getElementById('attendanceStudent').value.trim();
-            const status = document.getElementById('attendanceStatus').value;
-
-            if (!student) {
-                showMessage('attendanceMessage', 'Please enter a student name', false);
-                return;
-            }
-
-            try {
-                const response = await fetch('/mark_attendance', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({student: student, status: status})
-                });
-                const result = await response.json();
-                showMessage('attendanceMessage', result.message, result.success);
-                if (result.success) {
-                    document.getElementById('attendanceStudent').value = '';
-                }
-            } catch (error) {
-                showMessage('attendanceMessage', 'Error: ' + error.message, false);
-            }
-        }
-
-        async function loadStudents() {
-            try {
-                const response = await fetch('/get_students');
-                const result = await response.json();
-                
-                if (result.success) {
-                    let html = '<h3>Registered Students:</h3>';
-                    if (result.students.length > 0) {
-                        result.students.forEach(function(student) {
-                            html += '<div class="student-item">' + student + '</div>';
-                        });
-                    } else {
-                        html += '<p>No students registered yet.</p>';
-                    }
-                    document.getElementById('studentsList').innerHTML = html;
-                } else {
-                    document.getElementById('studentsList').innerHTML = '<div class="error">' + result.message + '</div>';
-                }
-            } catch (error) {
-                document.getElementById('studentsList').innerHTML = '<div class="error">Error loading students: ' + error.message + '</div>';
-            }
-        }
-
-        async function loadSummary() {
-            try {
-                const response = await fetch('/get_summary');
-                const result = await response.json();
-                
-                if (result.success) {
-                    let html = '<h3>Attendance Summary:</h3>';
-                    for (const student in result.summary) {
-                        const data = result.summary[student];
-                        html += '<div class="student-item">' +
-                                '<strong>' + student + '</strong><br>' +
-                                'Present: ' + data.present + '/' + data.total + ' days<br>' +
-                                'Attendance: ' + data.percentage + '%' +
-                                '</div>';
-                    }
-                    document.getElementById('summaryResult').innerHTML = html;
-                } else {
-                    document.getElementById('summaryResult').innerHTML = '<div class="error">' + result.message + '</div>';
-                }
-            } catch (error) {
-                document.getElementById('summaryResult').innerHTML = '<div class="error">Error loading summary: ' + error.message + '</div>';
-            }
-        }
-
-        async function loadRecords() {
-            try {
-                const response = await fetch('/get_records');
-                const result = await response.json();
-                
-                if (result.success) {
-                    let html = '<h3>All Records:</h3>';
-                    if (Object.keys(result.records).length > 0) {
-                        for (const date in result.records) {
-                            html += '<h4>' + date + ':</h4>';
-                            for (const student in result.records[date]) {
-                                html += '<div class="student-item">' + student + ': ' + result.records[date][student] + '</div>';
-                            }
-                        }
-                    } else {
-                        html += '<p>No attendance records yet.</p>';
-                    }
-                    document.getElementById('recordsResult').innerHTML = html;
-                } else {
-                    document.getElementById('recordsResult').innerHTML = '<div class="error">' + result.message + '</div>';
-                }
-            } catch (error) {
-                document.getElementById('recordsResult').innerHTML = '<div class="error">Error loading records: ' + error.message + '</div>';
-            }
-        }
-    </script>
-</body>
-</html>'''
-    
-    # Write with proper encoding to avoid Unicode errors
-    with open(os.path.join(template_dir, 'index.html'), 'w', encoding='utf-8') as f:
-        f.write(html_content)
-
 if __name__ == '__main__':
-    create_template()
     app.run(debug=False, host='0.0.0.0', port=5000)
\ No newline at end of file
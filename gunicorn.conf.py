@@ -0,0 +1,23 @@
+# Gunicorn settings: gunicorn -c gunicorn.conf.py app:app
+import os
+import sys
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+
+# AttendanceTracker keeps its state in process memory and locks its data
+# files, so scale with threads inside a single worker rather than workers
+workers = 1
+worker_class = "gthread"
+threads = int(os.environ.get("THREADS", 8))
+
+# On reload (HUP) the new worker boots before the old one exits and waits
+# for it to release the data files (AttendanceTracker.LOCK_TIMEOUT). Keep
+# the old worker's shutdown well inside that window.
+graceful_timeout = 10
+
+
+def worker_exit(server, worker):
+    """Flush the journal and release the data-file lock as the worker exits"""
+    app = sys.modules.get("app")
+    if app is not None:
+        app.tracker.close()
@@ -0,0 +1,14 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# app.py opens its module-level tracker on import; keep its files out of the checkout
+os.environ.setdefault("ATTENDANCE_FILE", os.path.join(tempfile.mkdtemp(), "attendance.json"))
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "attendance.json")
@@ -0,0 +1,88 @@
+import pytest
+
+import app
+from app import AttendanceTracker
+
+
+@pytest.fixture
+def tracker(path, monkeypatch):
+    tracker = AttendanceTracker(path)
+    monkeypatch.setattr(app, "tracker", tracker)
+    yield tracker
+    tracker.close()
+
+
+@pytest.fixture
+def client(tracker):
+    return app.app.test_client()
+
+
+def test_mark_attendance_is_durable_when_it_reports_success(client, path):
+    assert client.post('/add_student', json={'name': 'Ann'}).get_json()['success']
+    result = client.post('/mark_attendance', json={'student': 'Ann', 'status': 'present', 'date': '2024-01-01'})
+    assert result.get_json()['success']
+    with open(path + ".log", "rb") as f:
+        assert f.read().count(b"\n") == 2
+
+
+def test_failed_journal_write_is_reported_and_undone(client, tracker, monkeypatch):
+    client.post('/add_student', json={'name': 'Ann'})
+    write_batch = tracker.write_batch
+    def fail_once(data):
+        monkeypatch.setattr(tracker, "write_batch", write_batch)
+        raise OSError(28, 'No space left on device')
+    monkeypatch.setattr(tracker, "write_batch", fail_once)
+    result = client.post('/add_student', json={'name': 'Bob'}).get_json()
+    assert result['success'] is False
+    assert 'No space left on device' in result['message']
+    assert client.get('/get_students').get_json()['students'] == ['Ann']
+
+    assert client.post('/add_student', json={'name': 'Bob'}).get_json()['success']
+    assert client.get('/get_students').get_json()['students'] == ['Ann', 'Bob']
+
+
+@pytest.mark.parametrize('bad_date', [20240102, None, 'not-a-date'])
+def test_mark_attendance_rejects_bad_dates_without_counting_a_day(client, bad_date):
+    client.post('/add_student', json={'name': 'Ann'})
+    result = client.post('/mark_attendance', json={'student': 'Ann', 'status': 'present', 'date': bad_date})
+    assert result.get_json()['success'] is False
+    client.post('/mark_attendance', json={'student': 'Ann', 'status': 'present', 'date': '2024-01-01'})
+    summary = client.get('/get_summary').get_json()['summary']
+    assert summary['Ann'] == {'present': 1, 'total': 1, 'percentage': 100.0}
+
+
+def test_repeated_mark_reports_no_change_without_journalling(client, path):
+    client.post('/add_student', json={'name': 'Ann'})
+    mark = {'student': 'Ann', 'status': 'present', 'date': '2024-01-01'}
+    client.post('/mark_attendance', json=mark)
+    with open(path + ".log", "rb") as f:
+        journal = f.read()
+
+    result = client.post('/mark_attendance', json=mark).get_json()
+    assert result['success'] is True
+    assert '(no change)' in result['message']
+    with open(path + ".log", "rb") as f:
+        assert f.read() == journal
+
+
+def test_get_records_answers_304_for_a_matching_etag(client):
+    client.post('/add_student', json={'name': 'Ann'})
+    first = client.get('/get_records')
+    etag = first.headers['ETag']
+    assert first.status_code == 200
+
+    cached = client.get('/get_records', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.data == b''
+    assert cached.headers['ETag'] == etag
+
+
+def test_get_records_etag_changes_after_a_mark(client):
+    client.post('/add_student', json={'name': 'Ann'})
+    etag = client.get('/get_records').headers['ETag']
+    client.post('/mark_attendance', json={'student': 'Ann', 'status': 'present', 'date': '2024-01-01'})
+
+    fresh = client.get('/get_records', headers={'If-None-Match': etag})
+    assert fresh.status_code == 200
+    assert fresh.headers['ETag'] != etag
+    assert fresh.get_json()['records'] == {'2024-01-01': {'Ann': 'present'}}
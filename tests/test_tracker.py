@@ -0,0 +1,202 @@
+import errno
+import os
+import threading
+
+import pytest
+
+import app
+from app import AttendanceTracker
+
+
+def test_restart_replays_journal(path):
+    tracker = AttendanceTracker(path)
+    tracker.add_student("Ann")
+    tracker.mark_attendance("2024-01-01", "Ann", "present")
+    tracker.close()
+
+    tracker = AttendanceTracker(path)
+    assert list(tracker.students) == ["Ann"]
+    assert tracker.get_records() == {"2024-01-01": {"Ann": "present"}}
+    assert tracker.get_summary()["Ann"] == {'present': 1, 'total': 1, 'percentage': 100.0}
+    tracker.close()
+
+
+def test_torn_journal_tail_is_dropped_before_appending(path):
+    tracker = AttendanceTracker(path)
+    tracker.add_student("Ann")
+    tracker.close()
+    # Simulate a crash part-way through writing a journal line
+    with open(path + ".log", "ab") as f:
+        f.write(b'{"op":"ma')
+
+    tracker = AttendanceTracker(path)
+    tracker.add_student("Bob")
+    tracker.add_student("Cy")
+    tracker.close()
+
+    tracker = AttendanceTracker(path)
+    assert list(tracker.students) == ["Ann", "Bob", "Cy"]
+    tracker.close()
+    with open(path + ".log", "rb") as f:
+        assert b'{"op":"ma{' not in f.read()
+
+
+def test_compact_folds_journal_into_snapshot(path):
+    tracker = AttendanceTracker(path)
+    tracker.add_student("Ann")
+    tracker.mark_attendance("2024-01-01", "Ann", "present")
+    tracker.flush()
+    tracker.compact()
+    tracker.mark_attendance("2024-01-02", "Ann", "absent")
+    tracker.close()
+    with open(path + ".log", "rb") as f:
+        assert f.read().count(b"\n") == 1
+
+    tracker = AttendanceTracker(path)
+    assert tracker.get_records() == {"2024-01-01": {"Ann": "present"}, "2024-01-02": {"Ann": "absent"}}
+    tracker.close()
+
+
+def test_compaction_triggers_on_journal_size(path):
+    tracker = AttendanceTracker(path)
+    tracker.COMPACT_THRESHOLD = 200
+    tracker.add_student("Ann")
+    for day in range(1, 21):
+        tracker.mark_attendance(f"2024-01-{day:02d}", "Ann", "present")
+    tracker.close()
+    with open(path + ".log", "rb") as f:
+        assert len(f.read()) < 200
+
+    tracker = AttendanceTracker(path)
+    assert tracker.get_summary()["Ann"] == {'present': 20, 'total': 20, 'percentage': 100.0}
+    tracker.close()
+
+
+def test_replay_skips_journal_lines_covered_by_snapshot(path):
+    tracker = AttendanceTracker(path)
+    tracker.add_student("Ann")
+    tracker.mark_attendance("2024-01-01", "Ann", "absent")
+    tracker.mark_attendance("2024-01-01", "Ann", "present")
+    tracker.flush()
+    with open(path + ".log", "rb") as f:
+        journal = f.read()
+    # Crash after the snapshot was replaced but before the journal was cut
+    tracker.save_to_file()
+    tracker.close()
+    with open(path + ".log", "wb") as f:
+        f.write(journal.splitlines(keepends=True)[1])
+
+    tracker = AttendanceTracker(path)
+    assert tracker.get_records() == {"2024-01-01": {"Ann": "present"}}
+    tracker.mark_attendance("2024-01-02", "Ann", "present")
+    tracker.close()
+
+    tracker = AttendanceTracker(path)
+    assert tracker.get_summary()["Ann"]["present"] == 2
+    tracker.close()
+
+
+def test_close_stops_writer_and_rejects_later_writes(path):
+    tracker = AttendanceTracker(path)
+    tracker.add_student("Ann")
+    tracker.close()
+    assert not tracker._writer.is_alive()
+    with pytest.raises(RuntimeError):
+        tracker.add_student("Bob")
+
+    tracker = AttendanceTracker(path)
+    assert list(tracker.students) == ["Ann"]
+    tracker.close()
+
+
+@pytest.mark.skipif(app.fcntl is None, reason="file locking needs fcntl")
+def test_second_tracker_waits_for_the_lock(path):
+    first = AttendanceTracker(path)
+    first.add_student("Ann")
+    # Like the old worker during a gunicorn reload, release the files shortly
+    threading.Timer(0.3, first.close).start()
+
+    second = AttendanceTracker(path)
+    assert list(second.students) == ["Ann"]
+    second.close()
+
+
+@pytest.mark.skipif(app.fcntl is None, reason="file locking needs fcntl")
+def test_second_tracker_gives_up_when_the_lock_is_held(path, monkeypatch):
+    first = AttendanceTracker(path)
+    monkeypatch.setattr(AttendanceTracker, "LOCK_TIMEOUT", 0.2)
+    with pytest.raises(RuntimeError):
+        AttendanceTracker(path)
+    first.close()
+
+
+def test_rejected_status_leaves_no_phantom_date(path):
+    tracker = AttendanceTracker(path)
+    tracker.add_student("Ann")
+    with pytest.raises(KeyError):
+        tracker.mark_attendance("2024-01-01", "Ann", "late")
+    assert tracker.dates == []
+    assert tracker.get_records() == {}
+
+    tracker.mark_attendance("2024-01-01", "Ann", "present")
+    assert tracker.get_summary()["Ann"] == {'present': 1, 'total': 1, 'percentage': 100.0}
+    tracker.close()
+
+
+def flaky_journal_write(monkeypatch, tracker, fail):
+    """Make the next journal write stop after 5 bytes, then raise if fail is set"""
+    real_write = os.write
+    calls = []
+
+    def write(fd, data):
+        if fd != tracker.journal_fd or calls:
+            return real_write(fd, data)
+        calls.append(fd)
+        written = real_write(fd, bytes(data[:5]))
+        if fail:
+            raise OSError(errno.EIO, 'Input/output error')
+        return written
+    monkeypatch.setattr(os, "write", write)
+
+
+def test_failed_partial_write_is_rolled_back(path, monkeypatch):
+    tracker = AttendanceTracker(path)
+    tracker.add_student("Ann")
+    flaky_journal_write(monkeypatch, tracker, fail=True)
+    with pytest.raises(OSError):
+        tracker.add_student("Cy")
+    assert list(tracker.students) == ["Ann"]
+    tracker.mark_attendance("2024-01-01", "Ann", "present")
+    tracker.close()
+
+    tracker = AttendanceTracker(path)
+    assert list(tracker.students) == ["Ann"]
+    assert tracker.get_records() == {"2024-01-01": {"Ann": "present"}}
+    tracker.close()
+
+
+def test_short_write_is_completed(path, monkeypatch):
+    tracker = AttendanceTracker(path)
+    flaky_journal_write(monkeypatch, tracker, fail=False)
+    tracker.add_student("Ann")
+    tracker.close()
+
+    tracker = AttendanceTracker(path)
+    assert list(tracker.students) == ["Ann"]
+    tracker.close()
+
+
+def test_failed_compaction_does_not_fail_durable_writes(path, monkeypatch):
+    tracker = AttendanceTracker(path)
+    tracker.COMPACT_THRESHOLD = 1
+
+    def fail():
+        raise OSError(errno.EACCES, 'Permission denied')
+    monkeypatch.setattr(tracker, "save_to_file", fail)
+    tracker.add_student("Ann")
+    tracker.add_student("Bob")
+    tracker.close()
+
+    tracker = AttendanceTracker(path)
+    assert list(tracker.students) == ["Ann", "Bob"]
+    tracker.close()